@@ -3,18 +3,238 @@ Advanced Examples for Self-Healing SQL Data Analyst
 ===================================================
 
 This file demonstrates advanced usage patterns and integration scenarios.
+
+Usage:
+    python advanced_examples.py              # pause between examples
+    python advanced_examples.py --no-prompt  # run all examples unattended
+
+The harness itself (state building, result aggregation, output formatting,
+stream event dispatch) is plain Python, so it can also be run under PyPy
+to cut interpreter overhead when pointed at a fast or local LLM.
+requirements-pypy.txt lists only the runtime dependencies:
+
+    pypy3 -m pip install -r requirements-pypy.txt
+    pypy3 advanced_examples.py --no-prompt
 """
 
 from self_healing_sql_analyst import (
     build_self_healing_analyst,
     AnalystState,
     DatabaseManager,
-    Config
+    Config,
+    context_engineer,
+    db_manager
 )
 from langgraph.checkpoint.memory import MemorySaver
+from collections import deque
+from functools import lru_cache
+import argparse
+import asyncio
+import contextlib
+import copy
+import hashlib
+import os
+import sqlite3
+import sys
+import textwrap
 import time
 
 
+# Shape of a fresh AnalystState; copied by _make_state for each question
+_INITIAL_STATE_TEMPLATE = {
+    "question": "",
+    "sql_query": "",
+    "query_result": "",
+    "error_message": "",
+    "error_history": (),
+    "attempt_count": 0,
+    "schema_info": "",
+    "explanation": "",
+    "status": "pending",
+    "timestamp": ""
+}
+
+
+def _make_state(question):
+    """Return a fresh initial state for the given question."""
+    state = _INITIAL_STATE_TEMPLATE.copy()
+    state["question"] = question
+    state["error_history"] = []
+    return state
+
+
+@contextlib.contextmanager
+def _quiet():
+    """Discard anything printed to stdout inside the block."""
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        yield
+
+
+def _prewarm(app):
+    """
+    Run one throwaway question through the graph's async path.
+    
+    The first invocation pays one-time setup costs (client init, schema
+    loading); without this, the first timed sample in the performance
+    examples would include that overhead. The run is silenced, and the
+    shared query history is restored afterwards so the warm-up question
+    never shows up in later prompts.
+    """
+    saved_history = list(context_engineer.query_cache)
+    try:
+        with _quiet():
+            asyncio.run(app.ainvoke(_make_state("SELECT 1")))
+    except Exception as e:
+        print(f"⚠ Warm-up run failed: {e}", file=sys.stderr)
+    finally:
+        context_engineer.query_cache = saved_history
+
+
+@lru_cache(maxsize=1)
+def _get_graph():
+    """Build the analyst graph once; it can be compiled repeatedly."""
+    return build_self_healing_analyst()
+
+
+@lru_cache(maxsize=1)
+def _get_app():
+    """Compile and pre-warm the shared, checkpoint-free analyst graph once."""
+    app = _get_graph().compile()
+    _prewarm(app)
+    return app
+
+
+def _get_checkpointed_app():
+    """
+    Compile the analyst graph with a fresh MemorySaver.
+    
+    Not cached: each caller gets its own empty checkpoint history, so
+    repeated runs don't append to an earlier run's checkpoints.
+    """
+    return _get_graph().compile(checkpointer=MemorySaver())
+
+
+class CachedApp:
+    """
+    Exact-match result cache in front of a compiled analyst graph.
+    
+    Results are keyed by a SHA-256 of (canonical question, schema
+    version). Questions are normalized with _canonical(), as in
+    _run_questions(), and the schema version is a hash of the database
+    schema. A repeated question against an unchanged schema skips the
+    graph entirely. The schema is read once, not on every lookup; call
+    refresh_schema() after changing it so later lookups use new keys.
+    Only invoke/ainvoke are cached; anything else is passed through.
+    
+    Only the batch example uses this cache, and its batches are already
+    deduplicated. In a normal script run it therefore never hits. It pays
+    off only when a batch is run again in the same process, e.g. when
+    example_batch_processing() is called repeatedly from an interactive
+    session or a test.
+    """
+    
+    def __init__(self, app, db_manager):
+        self.app = app
+        self.db_manager = db_manager
+        self.cache = {}
+        self.refresh_schema()
+    
+    def refresh_schema(self):
+        """Re-read the schema; entries from the old schema stop matching."""
+        schema = self.db_manager.get_schema()
+        self.schema_version = hashlib.sha256(schema.encode("utf-8")).hexdigest()
+    
+    def _key(self, state):
+        payload = f"{_canonical(state['question'])}\x00{self.schema_version}"
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    
+    def invoke(self, state, *args, **kwargs):
+        key = self._key(state)
+        if key not in self.cache:
+            self.cache[key] = self.app.invoke(state, *args, **kwargs)
+        return copy.deepcopy(self.cache[key])
+    
+    async def ainvoke(self, state, *args, **kwargs):
+        key = self._key(state)
+        if key not in self.cache:
+            self.cache[key] = await self.app.ainvoke(state, *args, **kwargs)
+        return copy.deepcopy(self.cache[key])
+    
+    def __getattr__(self, name):
+        return getattr(self.app, name)
+
+
+@lru_cache(maxsize=1)
+def _get_cached_app():
+    """Shared result-caching wrapper around the plain compiled graph."""
+    return CachedApp(_get_app(), db_manager)
+
+
+# Upper bound on in-flight graph invocations, to stay under LLM rate limits
+MAX_CONCURRENT_QUERIES = 8
+
+
+async def _run_one(app, question, semaphore):
+    """Invoke the graph for one question and return (result, elapsed seconds)."""
+    async with semaphore:
+        # Build the state only once a slot is free, so at most
+        # MAX_CONCURRENT_QUERIES initial states are alive at a time
+        state = _make_state(question)
+        start = time.perf_counter()
+        result = await app.ainvoke(state)
+        return result, time.perf_counter() - start
+
+
+async def _run_all(app, questions):
+    """Invoke the graph concurrently for every question, preserving input order."""
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_QUERIES)
+    return await asyncio.gather(*[_run_one(app, q, semaphore) for q in questions])
+
+
+def _canonical(question):
+    """Normalized form under which two questions count as the same."""
+    return question.strip().lower()
+
+
+def _run_questions(app, questions):
+    """
+    Run a batch of questions concurrently, invoking each distinct one once.
+    
+    Questions are compared by _canonical(); blank ones are dropped.
+    Returns (outcomes, wall_time): outcomes holds
+    (question, result, elapsed, duplicate) for every remaining question, in
+    input order. A duplicate shares the result of the first occurrence but
+    was not run itself, so it reports 0s and should be left out of
+    per-query metrics. wall_time is the elapsed time of the whole
+    concurrent run.
+    """
+    questions = [q for q in questions if q.strip()]
+    unique = {}
+    for q in questions:
+        unique.setdefault(_canonical(q), q)
+    
+    # Sync graph nodes run on executor threads under ainvoke, so their
+    # multi-line progress banners would interleave; silence them here
+    with _quiet():
+        start = time.perf_counter()
+        outcomes = asyncio.run(_run_all(app, list(unique.values())))
+        wall_time = time.perf_counter() - start
+    result_map = dict(zip(unique, outcomes))
+    
+    fanned_out = []
+    seen = set()
+    for q in questions:
+        key = _canonical(q)
+        result, elapsed = result_map[key]
+        if key in seen:
+            fanned_out.append((q, result, 0.0, True))
+        else:
+            fanned_out.append((q, result, elapsed, False))
+            seen.add(key)
+    
+    return fanned_out, wall_time
+
+
 # ============================================================================
 # EXAMPLE 1: Custom Database Schema
 # ============================================================================
@@ -29,53 +249,55 @@ def example_custom_database():
     
     # Create custom database
     db = DatabaseManager("custom_sales.db")
-    conn = db.db_path
-    import sqlite3
-    
-    conn = sqlite3.connect("custom_sales.db")
-    cursor = conn.cursor()
-    
-    # Create custom schema
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS customers (
-            customer_id INTEGER PRIMARY KEY,
-            name TEXT,
-            segment TEXT,
-            country TEXT
+    conn = sqlite3.connect(db.db_path)
+    
+    # WAL + NORMAL sync avoids an fsync per statement during setup
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    
+    # Create schema and insert sample data in a single transaction
+    with conn:
+        conn.execute("BEGIN")
+        
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS customers (
+                customer_id INTEGER PRIMARY KEY,
+                name TEXT,
+                segment TEXT,
+                country TEXT
+            )
+        """)
+        
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS orders (
+                order_id INTEGER PRIMARY KEY,
+                customer_id INTEGER,
+                order_date TEXT,
+                amount REAL,
+                FOREIGN KEY (customer_id) REFERENCES customers(customer_id)
+            )
+        """)
+        
+        conn.executemany(
+            "INSERT INTO customers VALUES (?, ?, ?, ?)",
+            [
+                (1, "Acme Corp", "Enterprise", "USA"),
+                (2, "TechStart", "SMB", "UK"),
+                (3, "Global Inc", "Enterprise", "Germany")
+            ]
         )
-    """)
-    
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS orders (
-            order_id INTEGER PRIMARY KEY,
-            customer_id INTEGER,
-            order_date TEXT,
-            amount REAL,
-            FOREIGN KEY (customer_id) REFERENCES customers(customer_id)
+        
+        conn.executemany(
+            "INSERT INTO orders VALUES (?, ?, ?, ?)",
+            [
+                (1, 1, "2024-01-15", 50000),
+                (2, 1, "2024-02-20", 75000),
+                (3, 2, "2024-01-10", 15000),
+                (4, 3, "2024-03-05", 100000)
+            ]
         )
-    """)
-    
-    # Insert sample data
-    cursor.executemany(
-        "INSERT INTO customers VALUES (?, ?, ?, ?)",
-        [
-            (1, "Acme Corp", "Enterprise", "USA"),
-            (2, "TechStart", "SMB", "UK"),
-            (3, "Global Inc", "Enterprise", "Germany")
-        ]
-    )
-    
-    cursor.executemany(
-        "INSERT INTO orders VALUES (?, ?, ?, ?)",
-        [
-            (1, 1, "2024-01-15", 50000),
-            (2, 1, "2024-02-20", 75000),
-            (3, 2, "2024-01-10", 15000),
-            (4, 3, "2024-03-05", 100000)
-        ]
-    )
     
-    conn.commit()
     conn.close()
     
     print("✓ Custom database created successfully")
@@ -91,10 +313,16 @@ def example_custom_database():
 def example_batch_processing():
     """
     Process multiple questions in batch and compare results.
+    
+    Questions run concurrently, so the graph nodes' own progress output
+    is suppressed during the run; a condensed banner per question is
+    printed from the results afterwards instead.
     """
     print("\n" + "="*80)
     print("EXAMPLE 2: Batch Processing")
     print("="*80 + "\n")
+    print("Note: node output is suppressed while questions run concurrently;")
+    print("a summary banner is printed for each question once it completes.")
     
     questions = [
         "What is the total revenue?",
@@ -103,59 +331,111 @@ def example_batch_processing():
         "Show me the top 3 products by revenue"
     ]
     
-    # Build graph once
-    graph = build_self_healing_analyst()
-    app = graph.compile()
+    app = _get_cached_app()
     
-    results = []
+    # Run every distinct question concurrently
+    outcomes, wall_time = _run_questions(app, questions)
+    if not outcomes:
+        print("No non-blank questions to process.")
+        return
     
-    for i, question in enumerate(questions, 1):
-        print(f"\n[{i}/{len(questions)}] Processing: {question}")
-        
-        initial_state = {
-            "question": question,
-            "sql_query": "",
-            "query_result": "",
-            "error_message": "",
-            "error_history": [],
-            "attempt_count": 0,
-            "schema_info": "",
-            "explanation": "",
-            "status": "pending",
-            "timestamp": ""
-        }
+    successful = failed = total_attempts = duplicates = 0
+    total_time = 0.0
+    
+    for i, (question, result, elapsed, duplicate) in enumerate(outcomes, 1):
+        if duplicate:
+            duplicates += 1
+            sys.stdout.write(
+                f"\n[{i}/{len(outcomes)}] Skipped: {question}\n"
+                "  Duplicate of an earlier question; result reused\n"
+            )
+            continue
         
-        start_time = time.time()
-        result = app.invoke(initial_state)
-        elapsed = time.time() - start_time
+        if result["status"] == "success":
+            successful += 1
+        elif result["status"] == "failed":
+            failed += 1
+        total_attempts += result["attempt_count"]
+        total_time += elapsed
         
-        results.append({
-            "question": question,
-            "status": result["status"],
-            "attempts": result["attempt_count"],
-            "time": elapsed,
-            "explanation": result["explanation"]
-        })
+        if result["status"] == "success":
+            outcome_line = "✓ Query executed successfully!"
+        else:
+            outcome_line = f"⚠ Query failed after {len(result['error_history'])} error(s)"
         
-        print(f"  Status: {result['status']}")
-        print(f"  Attempts: {result['attempt_count']}")
-        print(f"  Time: {elapsed:.2f}s")
+        sys.stdout.write(
+            f"\n{'='*60}\n"
+            f"CONTEXT ENGINEERING IN ACTION [{i}/{len(outcomes)}]\n"
+            f"{'='*60}\n"
+            f"Question: {question}\n"
+            f"SQL: {result['sql_query'][:60]}...\n"
+            f"{outcome_line}\n"
+            f"  Status: {result['status']}\n"
+            f"  Attempts: {result['attempt_count']}\n"
+            f"  Time: {elapsed:.2f}s\n"
+        )
+    
+    executed = len(outcomes) - duplicates
     
     # Summary
     print("\n" + "="*80)
     print("BATCH PROCESSING SUMMARY")
     print("="*80)
-    print(f"Total Questions: {len(questions)}")
-    print(f"Successful: {sum(1 for r in results if r['status'] == 'success')}")
-    print(f"Failed: {sum(1 for r in results if r['status'] == 'failed')}")
-    print(f"Avg Attempts: {sum(r['attempts'] for r in results) / len(results):.1f}")
-    print(f"Total Time: {sum(r['time'] for r in results):.2f}s")
+    print(f"Total Questions: {len(outcomes)}")
+    print(f"Distinct Questions Run: {executed}")
+    print(f"Duplicates Skipped: {duplicates}")
+    print(f"Successful: {successful}")
+    print(f"Failed: {failed}")
+    print(f"Avg Attempts: {total_attempts / executed:.1f}")
+    print(f"Total Time: {wall_time:.2f}s")
+    print(f"Sum of Query Times: {total_time:.2f}s")
 
 
 # ============================================================================
 # EXAMPLE 3: Streaming Progress Updates
 # ============================================================================
 
+def _render_initialize(step, node_state):
+    return f"{step}. Initializing analysis...\n   → Loaded database schema\n"
+
+
+def _render_generate_sql(step, node_state):
+    sql = node_state.get("sql_query", "")[:60]
+    return f"{step}. Generating SQL query...\n   → SQL: {sql}...\n"
+
+
+def _render_execute_sql(step, node_state):
+    if node_state.get("error_message"):
+        return (
+            f"{step}. Execution failed!\n"
+            f"   ⚠ Error: {node_state['error_message'][:50]}...\n"
+        )
+    return f"{step}. Query executed successfully!\n   ✓ Retrieved results\n"
+
+
+def _render_analyze_error(step, node_state):
+    return f"{step}. Self-correcting error...\n   → Analyzing failure and generating new SQL\n"
+
+
+def _render_generate_explanation(step, node_state):
+    return f"{step}. Generating explanation...\n   → Creating natural language answer\n"
+
+
+def _render_handle_failure(step, node_state):
+    return f"{step}. Handling failure...\n   ⚠ Max retries exceeded\n"
+
+
+# Progress line renderers, keyed by graph node name
+_RENDERERS = {
+    "initialize": _render_initialize,
+    "generate_sql": _render_generate_sql,
+    "execute_sql": _render_execute_sql,
+    "analyze_error": _render_analyze_error,
+    "generate_explanation": _render_generate_explanation,
+    "handle_failure": _render_handle_failure,
+}
+
+
 def example_streaming_progress():
     """
     Demonstrate streaming to show real-time progress.
@@ -164,65 +444,32 @@ def example_streaming_progress():
     print("EXAMPLE 3: Streaming Progress Updates")
     print("="*80 + "\n")
     
-    graph = build_self_healing_analyst()
-    app = graph.compile()
+    app = _get_app()
     
     question = "What was our highest growth region in Q3?"
     
-    initial_state = {
-        "question": question,
-        "sql_query": "",
-        "query_result": "",
-        "error_message": "",
-        "error_history": [],
-        "attempt_count": 0,
-        "schema_info": "",
-        "explanation": "",
-        "status": "pending",
-        "timestamp": ""
-    }
+    initial_state = _make_state(question)
     
     print(f"Question: {question}\n")
     print("Processing Steps:")
     print("-" * 60)
     
+    # Optional pacing for live demos; DEMO_SLOW=0 or empty leaves it off
+    demo_slow = os.environ.get("DEMO_SLOW", "") not in ("", "0")
+    
     step_count = 0
     for output in app.stream(initial_state):
         step_count += 1
         node_name = list(output.keys())[0]
         node_state = output[node_name]
         
-        # Format output based on node type
-        if node_name == "initialize":
-            print(f"{step_count}. Initializing analysis...")
-            print(f"   → Loaded database schema")
+        # Format output based on node type, emitted in one write per event
+        renderer = _RENDERERS.get(node_name)
+        if renderer:
+            sys.stdout.write(renderer(step_count, node_state))
         
-        elif node_name == "generate_sql":
-            print(f"{step_count}. Generating SQL query...")
-            sql = node_state.get("sql_query", "")[:60]
-            print(f"   → SQL: {sql}...")
-        
-        elif node_name == "execute_sql":
-            if node_state.get("error_message"):
-                print(f"{step_count}. Execution failed!")
-                print(f"   ⚠ Error: {node_state['error_message'][:50]}...")
-            else:
-                print(f"{step_count}. Query executed successfully!")
-                print(f"   ✓ Retrieved results")
-        
-        elif node_name == "analyze_error":
-            print(f"{step_count}. Self-correcting error...")
-            print(f"   → Analyzing failure and generating new SQL")
-        
-        elif node_name == "generate_explanation":
-            print(f"{step_count}. Generating explanation...")
-            print(f"   → Creating natural language answer")
-        
-        elif node_name == "handle_failure":
-            print(f"{step_count}. Handling failure...")
-            print(f"   ⚠ Max retries exceeded")
-        
-        time.sleep(0.2)  # Simulate processing time
+        if demo_slow:
+            time.sleep(0.2)
     
     print("-" * 60)
     print(f"\nCompleted in {step_count} steps")
@@ -240,26 +487,13 @@ def example_state_inspection():
     print("EXAMPLE 4: State Inspection and Debugging")
     print("="*80 + "\n")
     
-    graph = build_self_healing_analyst()
-    memory = MemorySaver()
-    app = graph.compile(checkpointer=memory)
+    app = _get_checkpointed_app()
     
     config = {"configurable": {"thread_id": "debug_session"}}
     
     question = "What is the total revenue?"
     
-    initial_state = {
-        "question": question,
-        "sql_query": "",
-        "query_result": "",
-        "error_message": "",
-        "error_history": [],
-        "attempt_count": 0,
-        "schema_info": "",
-        "explanation": "",
-        "status": "pending",
-        "timestamp": ""
-    }
+    initial_state = _make_state(question)
     
     print(f"Question: {question}\n")
     
@@ -270,22 +504,34 @@ def example_state_inspection():
     print("State History:")
     print("-" * 60)
     
-    history = list(app.get_state_history(config))
-    
-    for i, state in enumerate(reversed(history), 1):
+    # History is yielded newest-first; keep only the fields we print,
+    # prepending so the summaries end up oldest-first
+    checkpoints = deque()
+    
+    for state in app.get_state_history(config):
+        values = state.values
+        checkpoints.appendleft((
+            state.next,
+            values.get('status', 'N/A'),
+            values.get('attempt_count', 0),
+            (values.get('sql_query') or "")[:50],
+            (values.get('error_message') or "")[:50]
+        ))
+    
+    for i, (next_node, status, attempts, sql, error) in enumerate(checkpoints, 1):
         print(f"\nCheckpoint {i}:")
-        print(f"  Next Node: {state.next}")
-        print(f"  Status: {state.values.get('status', 'N/A')}")
-        print(f"  Attempts: {state.values.get('attempt_count', 0)}")
+        print(f"  Next Node: {next_node}")
+        print(f"  Status: {status}")
+        print(f"  Attempts: {attempts}")
         
-        if state.values.get('sql_query'):
-            print(f"  SQL: {state.values['sql_query'][:50]}...")
+        if sql:
+            print(f"  SQL: {sql}...")
         
-        if state.values.get('error_message'):
-            print(f"  Error: {state.values['error_message'][:50]}...")
+        if error:
+            print(f"  Error: {error}...")
     
     print("\n" + "-" * 60)
-    print(f"Total Checkpoints: {len(history)}")
+    print(f"Total Checkpoints: {len(checkpoints)}")
 
 
 # ============================================================================
@@ -319,8 +565,7 @@ def example_error_recovery():
         }
     ]
     
-    graph = build_self_healing_analyst()
-    app = graph.compile()
+    app = _get_app()
     
     for i, test in enumerate(test_cases, 1):
         print(f"\nTest Case {i}: {test['name']}")
@@ -328,18 +573,7 @@ def example_error_recovery():
         print(f"Expected: {test['expected']}")
         print("-" * 60)
         
-        initial_state = {
-            "question": test['question'],
-            "sql_query": "",
-            "query_result": "",
-            "error_message": "",
-            "error_history": [],
-            "attempt_count": 0,
-            "schema_info": "",
-            "explanation": "",
-            "status": "pending",
-            "timestamp": ""
-        }
+        initial_state = _make_state(test['question'])
         
         result = app.invoke(initial_state)
         
@@ -374,39 +608,35 @@ def example_performance_monitoring():
         "Show me sales trends by region"
     ]
     
-    graph = build_self_healing_analyst()
-    app = graph.compile()
+    # Uncached on purpose: cache hits would skew the timing metrics
+    app = _get_app()
     
     metrics = {
         "total_time": 0,
+        "query_time_sum": 0,
         "successful_queries": 0,
         "failed_queries": 0,
         "total_attempts": 0,
         "retries_needed": 0,
+        "duplicate_queries": 0,
         "avg_time_per_query": 0
     }
     
     print("Running performance tests...\n")
     
-    for question in questions:
-        initial_state = {
-            "question": question,
-            "sql_query": "",
-            "query_result": "",
-            "error_message": "",
-            "error_history": [],
-            "attempt_count": 0,
-            "schema_info": "",
-            "explanation": "",
-            "status": "pending",
-            "timestamp": ""
-        }
-        
-        start = time.time()
-        result = app.invoke(initial_state)
-        elapsed = time.time() - start
+    outcomes, wall_time = _run_questions(app, questions)
+    if not outcomes:
+        print("No non-blank questions to process.")
+        return
+    
+    metrics["total_time"] = wall_time
+    
+    for _, result, elapsed, duplicate in outcomes:
+        if duplicate:
+            metrics["duplicate_queries"] += 1
+            continue
         
-        metrics["total_time"] += elapsed
+        metrics["query_time_sum"] += elapsed
         metrics["total_attempts"] += result["attempt_count"]
         
         if result["status"] == "success":
@@ -417,20 +647,24 @@ def example_performance_monitoring():
         if result["attempt_count"] > 1:
             metrics["retries_needed"] += 1
     
-    metrics["avg_time_per_query"] = metrics["total_time"] / len(questions)
+    # Per-query metrics only cover questions that were actually run
+    executed = len(outcomes) - metrics["duplicate_queries"]
+    metrics["avg_time_per_query"] = metrics["query_time_sum"] / executed
     
     # Display metrics
     print("="*60)
     print("PERFORMANCE METRICS")
     print("="*60)
-    print(f"Total Queries: {len(questions)}")
+    print(f"Total Queries: {executed}")
+    print(f"Duplicates Skipped: {metrics['duplicate_queries']}")
     print(f"Successful: {metrics['successful_queries']}")
     print(f"Failed: {metrics['failed_queries']}")
-    print(f"Success Rate: {metrics['successful_queries']/len(questions)*100:.1f}%")
+    print(f"Success Rate: {metrics['successful_queries']/executed*100:.1f}%")
     print(f"\nTotal Attempts: {metrics['total_attempts']}")
     print(f"Queries Needing Retry: {metrics['retries_needed']}")
-    print(f"Avg Attempts per Query: {metrics['total_attempts']/len(questions):.2f}")
+    print(f"Avg Attempts per Query: {metrics['total_attempts']/executed:.2f}")
     print(f"\nTotal Time: {metrics['total_time']:.2f}s")
+    print(f"Sum of Query Times: {metrics['query_time_sum']:.2f}s")
     print(f"Avg Time per Query: {metrics['avg_time_per_query']:.2f}s")
 
 
@@ -438,17 +672,7 @@ def example_performance_monitoring():
 # EXAMPLE 7: Integration with External LLM
 # ============================================================================
 
-def example_openai_integration():
-    """
-    Demonstrate integration with OpenAI GPT models.
-    Note: Requires OPENAI_API_KEY environment variable.
-    """
-    print("\n" + "="*80)
-    print("EXAMPLE 7: OpenAI Integration (Mock)")
-    print("="*80 + "\n")
-    
-    print("To integrate with OpenAI:")
-    print("""
+_OPENAI_HELP = textwrap.dedent("""
     1. Install: pip install langchain-openai
     
     2. Update LLMService class:
@@ -485,7 +709,20 @@ def example_openai_integration():
     
     3. Set environment variable:
        export OPENAI_API_KEY='your-api-key'
-    """)
+""")
+
+
+def example_openai_integration():
+    """
+    Demonstrate integration with OpenAI GPT models.
+    Note: Requires OPENAI_API_KEY environment variable.
+    """
+    print("\n" + "="*80)
+    print("EXAMPLE 7: OpenAI Integration (Mock)")
+    print("="*80 + "\n")
+    
+    print("To integrate with OpenAI:")
+    print(_OPENAI_HELP)
 
 
 # ============================================================================
@@ -497,6 +734,15 @@ if __name__ == "__main__":
     Run all advanced examples
     """
     
+    parser = argparse.ArgumentParser(description="Run the advanced examples")
+    parser.add_argument(
+        "--no-prompt",
+        action="store_true",
+        help="Run all examples back-to-back without waiting for Enter"
+    )
+    args = parser.parse_args()
+    interactive = not args.no_prompt and sys.stdin.isatty()
+    
     examples = [
         ("Custom Database", example_custom_database),
         ("Batch Processing", example_batch_processing),
@@ -517,7 +763,7 @@ if __name__ == "__main__":
         except Exception as e:
             print(f"\n⚠ Example {i} ({name}) encountered an error: {e}")
         
-        if i < len(examples):
+        if interactive and i < len(examples):
             input("\nPress Enter to continue to next example...")
     
     print("\n" + "#"*80)
@@ -46,6 +46,7 @@ BENEFITS:
 """
 
 import sqlite3
+import threading
 from typing import TypedDict, Annotated, Literal
 from langgraph.graph import StateGraph, END
 from langgraph.checkpoint.memory import MemorySaver
@@ -277,6 +278,7 @@ class ContextEngineer:
     def __init__(self, db_manager: DatabaseManager):
         self.db_manager = db_manager
         self.query_cache = []  # Store successful queries
+        self._history_lock = threading.Lock()  # Nodes may run on worker threads
     
     def build_schema_context(self) -> str:
         """
@@ -519,15 +521,16 @@ GROUP BY region;""",
         
         Historical queries help the LLM learn from past successes.
         """
-        self.query_cache.append({
-            "question": question,
-            "sql": sql,
-            "timestamp": datetime.now().isoformat()
-        })
-        
-        # Keep only recent queries
-        if len(self.query_cache) > Config.MAX_HISTORY_QUERIES:
-            self.query_cache = self.query_cache[-Config.MAX_HISTORY_QUERIES:]
+        with self._history_lock:
+            self.query_cache.append({
+                "question": question,
+                "sql": sql,
+                "timestamp": datetime.now().isoformat()
+            })
+            
+            # Keep only recent queries
+            if len(self.query_cache) > Config.MAX_HISTORY_QUERIES:
+                self.query_cache = self.query_cache[-Config.MAX_HISTORY_QUERIES:]
     
     def get_query_history_context(self) -> str:
         """